@@ -0,0 +1,107 @@
+"""Minimal client for kitty's remote-control socket ($KITTY_LISTEN_ON).
+
+Talking to the socket directly skips starting a `kitten @` process for
+every command. Requires `allow_remote_control` and `listen_on` in kitty.conf.
+"""
+
+import json
+import os
+import socket
+from typing import Any
+
+# Version sent with each command; kitty only uses it for compatibility checks.
+PROTOCOL_VERSION = [0, 26, 0]
+
+_PREFIX = b"\x1bP@kitty-cmd"
+_SUFFIX = b"\x1b\\"
+
+
+class RemoteControlError(Exception):
+    """kitty could not be reached or refused the command."""
+
+
+class KittyRemote:
+    """Connection to kitty's remote-control socket, opened once and reused."""
+
+    def __init__(self, address: str, timeout: float = 2.0) -> None:
+        self.address = address
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+
+    @classmethod
+    def from_env(cls) -> "KittyRemote | None":
+        """Client for $KITTY_LISTEN_ON, or None if kitty is not listening on a UNIX socket."""
+        listen_on = os.environ.get("KITTY_LISTEN_ON", "")
+        if not listen_on.startswith("unix:"):
+            return None
+        address = listen_on[len("unix:"):]
+        if address.startswith("@"):
+            # Linux abstract socket namespace
+            address = "\0" + address[1:]
+        return cls(address)
+
+    def connect(self) -> socket.socket:
+        """Open the connection now (no-op if already open); raises OSError if kitty is unreachable."""
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+        return self._sock
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def send(self, cmd: str, payload: dict[str, Any]) -> Any:
+        """Run one remote-control command and return its "data" field.
+
+        Raises RemoteControlError if kitty cannot be reached or reports an error.
+        """
+        message: dict[str, Any] = {
+            "cmd": cmd,
+            "version": PROTOCOL_VERSION,
+            "no_response": False,
+            "payload": payload,
+        }
+        window_id = os.environ.get("KITTY_WINDOW_ID", "")
+        if window_id.isdigit():
+            message["kitty_window_id"] = int(window_id)
+        frame = _PREFIX + json.dumps(message).encode() + _SUFFIX
+        try:
+            try:
+                reply = self._exchange(frame)
+            except (BrokenPipeError, ConnectionResetError, EOFError):
+                # kitty dropped the idle connection; it never saw this command
+                self.close()
+                reply = self._exchange(frame)
+        except (OSError, EOFError) as e:
+            self.close()
+            raise RemoteControlError(f"kitty remote control unavailable: {e}") from e
+        if not reply.get("ok"):
+            raise RemoteControlError(reply.get("error") or f"{cmd} failed")
+        return reply.get("data")
+
+    def _exchange(self, frame: bytes) -> dict[str, Any]:
+        sock = self.connect()
+        sock.sendall(frame)
+        buf = b""
+        while not buf.endswith(_SUFFIX):
+            chunk = sock.recv(65536)
+            if not chunk:
+                if buf:
+                    raise OSError("connection closed mid-reply")
+                raise EOFError("connection closed by kitty")
+            buf += chunk
+        start = buf.find(_PREFIX)
+        if start < 0:
+            raise OSError("malformed reply from kitty")
+        try:
+            return json.loads(buf[start + len(_PREFIX):-len(_SUFFIX)])
+        except ValueError as e:
+            raise OSError("malformed reply from kitty") from e
@@ -0,0 +1,72 @@
+"""Substring index for the filter box of the theme and host selectors."""
+
+from collections.abc import Iterable
+
+# Longest window kept in the table; longer queries intersect these windows.
+_WINDOW = 3
+# Joins an entry's columns into one haystack; never part of a typed query.
+_SEPARATOR = "\x00"
+
+
+class NameIndex:
+    """
+    Case-insensitive substring index over one or more parallel name columns.
+
+    An entry matches when any of its columns (e.g. display name and host
+    alias) contains the query. Names are compared casefolded, so "STRASSE"
+    finds "Straße". Each entry's casefolded columns are joined with NUL into
+    a single haystack string, so confirming a match is one substring test.
+
+    Every 1-, 2- and 3-character window of each casefolded name maps to the
+    set of entry indices containing it. Queries up to three characters are a
+    single table lookup; longer ones intersect the sets for each
+    three-character window of the query and confirm the (few) survivors
+    against their haystacks.
+
+    The last query and its result are remembered: when the new query extends
+    the previous one (the usual case while typing), only the previous hits
+    are rechecked.
+    """
+
+    def __init__(self, *columns: Iterable[str]) -> None:
+        self._haystacks: list[str] = []
+        self._windows: dict[str, set[int]] = {}
+        for index, fields in enumerate(zip(*columns)):
+            names = [field.casefold() for field in fields]
+            self._haystacks.append(_SEPARATOR.join(names))
+            for name in names:
+                for size in range(1, _WINDOW + 1):
+                    for start in range(len(name) - size + 1):
+                        self._windows.setdefault(name[start:start + size], set()).add(index)
+        self._last_query = ""
+        self._last_indices: list[int] = list(range(len(self._haystacks)))
+
+    def search(self, query: str) -> list[int]:
+        """Indices (ascending) of entries containing query, ignoring case."""
+        query = query.casefold()
+        if self._last_query and query.startswith(self._last_query):
+            indices = self._confirm(query, self._last_indices)
+        else:
+            indices = self._lookup(query)
+        self._last_query = query
+        self._last_indices = indices
+        return list(indices)
+
+    def _lookup(self, query: str) -> list[int]:
+        if not query:
+            return list(range(len(self._haystacks)))
+        if len(query) <= _WINDOW:
+            return sorted(self._windows.get(query, ()))
+        windows = []
+        for start in range(len(query) - _WINDOW + 1):
+            hits = self._windows.get(query[start:start + _WINDOW])
+            if not hits:
+                return []
+            windows.append(hits)
+        windows.sort(key=len)
+        candidates = windows[0].intersection(*windows[1:])
+        return self._confirm(query, sorted(candidates))
+
+    def _confirm(self, query: str, indices: list[int]) -> list[int]:
+        haystacks = self._haystacks
+        return [i for i in indices if query in haystacks[i]]
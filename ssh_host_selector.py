@@ -1,16 +1,37 @@
 #!/usr/bin/env python3
 """SSH host selector — TUI to list hosts from ~/.ssh/config and connect (same list style as theme selector)."""
 
+import functools
+import mmap
+import operator
 import os
-import subprocess
+import re
 from pathlib import Path
 
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.containers import VerticalScroll
-from textual.widgets import Footer, Header, Input, Label, ListItem, ListView, Static
-
-
+# The only lines parse_ssh_config cares about: Host, User and the
+# "# kitty theme: value" / "# kitty theme=value" comment. Everything else
+# (blank lines, other keywords, other comments) is skipped by the regex engine.
+_SSH_RE = re.compile(
+    rb"^[ \t]*(?:"
+    rb"host[ \t]+(?P<hosts>\S[^\r\n]*?)"
+    rb"|user[ \t]+(?P<user>\S[^\r\n]*?)"
+    rb"|#[ \t]*kitty theme[:=][ \t]*(?P<theme>\S[^\r\n]*?)"
+    rb")[ \t\r]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _scan_ssh_config(config_path: Path) -> list[tuple[bytes | None, bytes | None, bytes | None]]:
+    """(hosts, user, theme) groups of each _SSH_RE match, scanned in place from an mmap of the file."""
+    with open(config_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return [match.group("hosts", "user", "theme") for match in _SSH_RE.finditer(data)]
+
+
+@functools.lru_cache(maxsize=1)
 def get_ssh_config_path() -> Path:
     """SSH config path (respects SSH_CONFIG_ENV or default ~/.ssh/config)."""
     path = os.environ.get("SSH_CONFIG_ENV", "").strip()
@@ -29,214 +50,46 @@ def parse_ssh_config(config_path: Path) -> list[tuple[str, str, str | None]]:
     """
     if not config_path.is_file():
         return []
-    entries: list[tuple[str, str, str | None]] = []
+    # Dedupe by alias, keep first occurrence; the last column is the sort key
+    by_alias: dict[str, tuple[str, str, str | None, str]] = {}
     try:
-        text = config_path.read_text(encoding="utf-8", errors="replace")
+        directives = _scan_ssh_config(config_path)
     except OSError:
         return []
     current_hosts: list[str] = []
     current_user: str | None = None
     current_theme: str | None = None
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if line.lower().startswith("host "):
+    for hosts, user, theme in directives:
+        if hosts is not None:
             if current_hosts:
                 for alias in current_hosts:
                     if alias and alias != "*":
                         display = f"{current_user}@{alias}" if current_user else alias
-                        entries.append((display, alias, current_theme))
-            parts = line.split(None, 1)
-            current_hosts = parts[1].split() if len(parts) > 1 else []
+                        by_alias.setdefault(alias, (display, alias, current_theme, display.casefold()))
+            current_hosts = hosts.decode("utf-8", errors="replace").split()
             current_user = None
             current_theme = None
-            continue
-        if not line:
-            continue
-        if line.startswith("#"):
+        elif user is not None:
+            current_user = user.decode("utf-8", errors="replace")
+        else:
             # Optional: # kitty theme: value  or  # kitty theme=value (value kept as-is)
-            rest = line[1:].strip()
-            rlower = rest.lower()
-            if rlower.startswith("kitty theme:") or rlower.startswith("kitty theme="):
-                sep = ":" if ":" in rest else "="
-                value = rest.split(sep, 1)[1].strip()
-                if value:
-                    current_theme = value
-            continue
-        key_value = line.split(None, 1)
-        if len(key_value) >= 2 and key_value[0].lower() == "user":
-            current_user = key_value[1].strip()
+            current_theme = theme.decode("utf-8", errors="replace")
     if current_hosts:
         for alias in current_hosts:
             if alias and alias != "*":
                 display = f"{current_user}@{alias}" if current_user else alias
-                entries.append((display, alias, current_theme))
-    # Dedupe by alias, keep first occurrence
-    seen: set[str] = set()
-    unique: list[tuple[str, str, str | None]] = []
-    for display, alias, theme in entries:
-        if alias not in seen:
-            seen.add(alias)
-            unique.append((display, alias, theme))
-    unique.sort(key=lambda x: (x[0].lower(), x[1]))
-    return unique
-
-
-class SSHHostSelectorApp(App[None]):
-    """TUI to pick an SSH host and connect (kitten ssh or ssh)."""
-
-    TITLE = "SSH host selector"
-    SUB_TITLE = "↑/↓ move · Enter connect · / filter · q quit"
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-    #host-list {
-        height: 1fr;
-        padding: 1 2;
-        border: solid $primary;
-    }
-    ListView {
-        padding: 0 1;
-    }
-    ListItem {
-        padding: 0 1;
-    }
-    ListItem:focus {
-        background: $primary 20%;
-    }
-    #search {
-        width: 100%;
-        margin: 0 2 1 2;
-        max-width: 60;
-    }
-    #status {
-        height: auto;
-        padding: 0 2 1 2;
-        color: $text-muted;
-    }
-    """
-
-    BINDINGS = [
-        Binding("q", "quit", "Quit"),
-        Binding("/", "focus_search", "Filter", show=True),
-    ]
-
-    def __init__(self, *, use_kitten_ssh: bool = True) -> None:
-        super().__init__()
-        self.use_kitten_ssh = use_kitten_ssh
-        self.hosts: list[tuple[str, str, str | None]] = []
-        self._filtered: list[tuple[str, str, str | None]] = []
+                by_alias.setdefault(alias, (display, alias, current_theme, display.casefold()))
+    unique = sorted(by_alias.values(), key=operator.itemgetter(3, 1))
+    return [(display, alias, theme) for display, alias, theme, _key in unique]
 
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Input(placeholder="Filter hosts...", id="search")
-        yield VerticalScroll(
-            ListView(id="host-list"),
-            id="list-container",
-        )
-        yield Static("", id="status")
-        yield Footer()
 
-    async def on_mount(self) -> None:
-        config_path = get_ssh_config_path()
-        self.hosts = parse_ssh_config(config_path)
-        self._filtered = list(self.hosts)
-        await self._refresh_list()
-        search = self.query_one("#search", Input)
-        search.display = False
-        status = self.query_one("#status", Static)
-        status.update(f"{len(self._filtered)} host(s) from {config_path}")
-
-    async def _refresh_list(self) -> None:
-        lv = self.query_one("#host-list", ListView)
-        await lv.clear()
-        await lv.extend([
-            ListItem(Label(display)) for display, _alias, _theme in self._filtered
-        ])
-
-    def _connect(self, host_alias: str, theme: str | None = None) -> bool:
-        """Launch SSH in a new kitty tab if possible; otherwise take over current terminal via exec."""
-        if self.use_kitten_ssh:
-            # Build: kitten ssh [--kitten color_scheme=THEME] host
-            ssh_argv = ["kitten", "ssh"]
-            if theme:
-                ssh_argv.extend(["--kitten", f"color_scheme={theme}"])
-            ssh_argv.append(host_alias)
-            # Prefer opening a new tab so the selector can close cleanly
-            try:
-                r = subprocess.run(
-                    ["kitten", "@", "launch", "--type=tab", "--cwd", "current"]
-                    + ssh_argv,
-                    capture_output=True,
-                    timeout=5,
-                )
-                if r.returncode == 0:
-                    return True
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-            # Fallback: exec in current process so this terminal becomes the SSH session
-            try:
-                os.execvp("kitten", ssh_argv)
-            except FileNotFoundError:
-                pass
-            try:
-                os.execvp("ssh", ["ssh", host_alias])
-            except FileNotFoundError:
-                return False
-        else:
-            # Plain ssh: try new tab first, then exec in current terminal
-            try:
-                r = subprocess.run(
-                    ["kitten", "@", "launch", "--type=tab", "--cwd", "current", "ssh", host_alias],
-                    capture_output=True,
-                    timeout=5,
-                )
-                if r.returncode == 0:
-                    return True
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-            try:
-                os.execvp("ssh", ["ssh", host_alias])
-            except FileNotFoundError:
-                return False
-        return False
-
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        idx = event.index
-        if idx < 0 or idx >= len(self._filtered):
-            return
-        display, host_alias, theme = self._filtered[idx]
-        if self._connect(host_alias, theme):
-            self.notify(f"Connecting to {display}…", severity="information", timeout=2)
-            self.exit()
-        else:
-            self.notify(
-                "Could not run kitten ssh or ssh (not in PATH)",
-                severity="error",
-                timeout=5,
-            )
-
-    def action_focus_search(self) -> None:
-        search = self.query_one("#search", Input)
-        if search.display:
-            search.blur()
-            search.display = False
-        else:
-            search.display = True
-            search.focus()
-
-    def on_input_changed(self, event: Input.Changed) -> None:
-        query = (event.value or "").strip().lower()
-        if not query:
-            self._filtered = list(self.hosts)
-        else:
-            self._filtered = [
-                (d, a, t) for d, a, t in self.hosts
-                if query in d.lower() or query in a.lower()
-            ]
-        self.run_worker(self._refresh_list())
-        status = self.query_one("#status", Static)
-        status.update(f"{len(self._filtered)} host(s)")
+def __getattr__(name: str):
+    # SSHHostSelectorApp lives in ssh_host_selector_app so that importing this
+    # module (or running --help) does not pull in Textual
+    if name == "SSHHostSelectorApp":
+        from ssh_host_selector_app import SSHHostSelectorApp
+        return SSHHostSelectorApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
@@ -248,6 +101,7 @@ def main() -> None:
         help="Use plain 'ssh' instead of 'kitten ssh'",
     )
     args = p.parse_args()
+    from ssh_host_selector_app import SSHHostSelectorApp
     app = SSHHostSelectorApp(use_kitten_ssh=not args.ssh)
     app.run()
 
@@ -0,0 +1,233 @@
+"""Textual app for ssh_host_selector; kept separate so --help answers without importing Textual."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.timer import Timer
+from textual.widgets import Footer, Header, Input, OptionList, Static
+from textual.widgets.option_list import Option
+
+from kitty_remote import KittyRemote, RemoteControlError
+from search_index import NameIndex
+from ssh_host_selector import get_ssh_config_path, parse_ssh_config
+
+# Keystrokes closer together than this are coalesced into one list refresh.
+REFRESH_DELAY = 0.05
+
+
+class SSHHostSelectorApp(App[None]):
+    """TUI to pick an SSH host and connect (kitten ssh or ssh)."""
+
+    TITLE = "SSH host selector"
+    SUB_TITLE = "↑/↓ move · Enter connect · / filter · q quit"
+    CSS = """
+    Screen {
+        layout: vertical;
+    }
+    #host-list {
+        height: 1fr;
+        padding: 1 2;
+        border: solid $primary;
+    }
+    OptionList > .option-list--option {
+        padding: 0 1;
+    }
+    #search {
+        width: 100%;
+        margin: 0 2 1 2;
+        max-width: 60;
+    }
+    #status {
+        height: auto;
+        padding: 0 2 1 2;
+        color: $text-muted;
+    }
+    """
+
+    BINDINGS = [
+        Binding("q", "quit", "Quit"),
+        Binding("/", "focus_search", "Filter", show=True),
+    ]
+
+    def __init__(self, *, use_kitten_ssh: bool = True) -> None:
+        super().__init__()
+        self.use_kitten_ssh = use_kitten_ssh
+        self._remote = KittyRemote.from_env()
+        # `kitten @` can only reach kitty through $KITTY_LISTEN_ON or, from inside
+        # a kitty window, the controlling tty; without either don't bother trying
+        self._has_kitty_ctl = shutil.which("kitten") is not None and bool(
+            os.environ.get("KITTY_LISTEN_ON") or os.environ.get("KITTY_WINDOW_ID")
+        )
+        self.hosts: list[tuple[str, str, str | None]] = []
+        self._filtered: list[tuple[str, str, str | None]] = []
+        # One Option per entry, built once and re-added on every refresh
+        self._options: list[Option] = []
+        self._filtered_options: list[Option] = []
+        # What the OptionList currently holds (entries and their Options), and
+        # the query it was filtered by; selections index _shown, since
+        # _filtered runs ahead of the screen until the debounce timer fires
+        self._shown: list[tuple[str, str, str | None]] = []
+        self._shown_options: list[Option] = []
+        self._last_query: str | None = None
+        self._refresh_timer: Timer | None = None
+        self._index = NameIndex()
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Input(placeholder="Filter hosts...", id="search")
+        # OptionList draws rows itself instead of mounting a widget per entry;
+        # only visible rows are painted, though a refresh still lays out every row
+        yield OptionList(id="host-list")
+        yield Static("", id="status")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        search = self.query_one("#search", Input)
+        search.display = False
+        self.query_one("#host-list", OptionList).focus()
+        self.query_one("#status", Static).update("Loading hosts…")
+        # Reading ~/.ssh/config can stall on a slow home directory; keep it off the UI thread
+        self.run_worker(self._load_hosts, thread=True, exclusive=True)
+
+    def _load_hosts(self) -> None:
+        config_path = get_ssh_config_path()
+        hosts = parse_ssh_config(config_path)
+        index = NameIndex(
+            [display for display, _alias, _theme in hosts],
+            [alias for _display, alias, _theme in hosts],
+        )
+        self.call_from_thread(self._hosts_loaded, config_path, hosts, index)
+
+    def _hosts_loaded(
+        self,
+        config_path: Path,
+        hosts: list[tuple[str, str, str | None]],
+        index: NameIndex,
+    ) -> None:
+        self.hosts = hosts
+        self._index = index
+        # Plain Text prompts: nothing to markup-parse when the list re-renders
+        self._options = [Option(Text(display)) for display, _alias, _theme in self.hosts]
+        # Honour anything typed into the filter while we were loading
+        self._last_query = None
+        value = self.query_one("#search", Input).value
+        self._apply_filter(value)
+        self._refresh_list()
+        if not value.strip():
+            status = self.query_one("#status", Static)
+            status.update(f"{len(self._filtered)} host(s) from {config_path}")
+
+    def _refresh_list(self) -> None:
+        if self._filtered_options == self._shown_options:
+            # Same rows as on screen (e.g. a keystroke every match satisfies)
+            return
+        ol = self.query_one("#host-list", OptionList)
+        # Clear, refill and re-highlight as one repaint rather than three
+        with self.batch_update():
+            ol.clear_options()
+            ol.add_options(self._filtered_options)
+            if self._filtered:
+                ol.highlighted = 0
+        self._shown = self._filtered
+        self._shown_options = self._filtered_options
+
+    def _launch_tab(self, argv: list[str]) -> bool:
+        """Run argv in a new kitty tab; False if kitty could not be asked to."""
+        if self._remote is not None:
+            try:
+                self._remote.send("launch", {"type": "tab", "cwd": "current", "args": argv})
+                return True
+            except RemoteControlError:
+                pass
+        if not self._has_kitty_ctl:
+            return False
+        try:
+            r = subprocess.run(
+                ["kitten", "@", "launch", "--type=tab", "--cwd", "current"] + argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=1,
+                close_fds=False,
+            )
+            return r.returncode == 0
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return False
+
+    def _connect(self, host_alias: str, theme: str | None = None) -> bool:
+        """Launch SSH in a new kitty tab if possible; otherwise take over current terminal via exec."""
+        if self.use_kitten_ssh:
+            # Build: kitten ssh [--kitten color_scheme=THEME] host
+            ssh_argv = ["kitten", "ssh"]
+            if theme:
+                ssh_argv.extend(["--kitten", f"color_scheme={theme}"])
+            ssh_argv.append(host_alias)
+            # Prefer opening a new tab so the selector can close cleanly
+            if self._launch_tab(ssh_argv):
+                return True
+            # Fallback: exec in current process so this terminal becomes the SSH session
+            try:
+                os.execvp("kitten", ssh_argv)
+            except FileNotFoundError:
+                pass
+            try:
+                os.execvp("ssh", ["ssh", host_alias])
+            except FileNotFoundError:
+                return False
+        else:
+            # Plain ssh: try new tab first, then exec in current terminal
+            if self._launch_tab(["ssh", host_alias]):
+                return True
+            try:
+                os.execvp("ssh", ["ssh", host_alias])
+            except FileNotFoundError:
+                return False
+        return False
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        idx = event.option_index
+        if idx < 0 or idx >= len(self._shown):
+            return
+        display, host_alias, theme = self._shown[idx]
+        if self._connect(host_alias, theme):
+            self.notify(f"Connecting to {display}…", severity="information", timeout=2)
+            self.exit()
+        else:
+            self.notify(
+                "Could not run kitten ssh or ssh (not in PATH)",
+                severity="error",
+                timeout=5,
+            )
+
+    def action_focus_search(self) -> None:
+        search = self.query_one("#search", Input)
+        if search.display:
+            search.blur()
+            search.display = False
+        else:
+            search.display = True
+            search.focus()
+
+    def _apply_filter(self, value: str) -> bool:
+        """Filter by value; False (and nothing done) if it normalizes to the current query."""
+        query = (value or "").strip().casefold()
+        if query == self._last_query:
+            return False
+        self._last_query = query
+        indices = self._index.search(query)
+        self._filtered = [self.hosts[i] for i in indices]
+        self._filtered_options = [self._options[i] for i in indices]
+        status = self.query_one("#status", Static)
+        status.update(f"{len(self._filtered)} host(s)")
+        return True
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if not self._apply_filter(event.value):
+            return
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(REFRESH_DELAY, self._refresh_list)
@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
 """Kitty theme selector — TUI to list and apply themes from ~/.config/kitty."""
 
+import functools
 import os
-import subprocess
+import pickle
+import re
 from pathlib import Path
 
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.containers import VerticalScroll
-from textual.widgets import Footer, Header, Input, Label, ListItem, ListView, Static
-
-
+# Bump when the layout of the pickled theme cache changes.
+THEME_CACHE_VERSION = 1
+
+# Theme settings that `kitten @ set-colors` applies (besides color0..color255).
+# Any other setting in a theme sends it through kitten instead, so a theme
+# using a color option missing here (or added by a newer kitty) is never
+# applied partially over the socket.
+_COLOR_KEYS = frozenset({
+    "foreground", "background", "selection_foreground", "selection_background",
+    "cursor", "cursor_text_color", "cursor_trail_color", "url_color",
+    "active_border_color", "inactive_border_color", "bell_border_color", "visual_bell_color",
+    "active_tab_foreground", "active_tab_background",
+    "inactive_tab_foreground", "inactive_tab_background",
+    "tab_bar_background", "tab_bar_margin_color",
+    "mark1_foreground", "mark1_background", "mark2_foreground", "mark2_background",
+    "mark3_foreground", "mark3_background",
+})
+_HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+
+@functools.lru_cache(maxsize=1)
 def get_kitty_config_dir() -> Path:
     """Kitty config directory (respects KITTY_CONFIG_DIRECTORY)."""
     env = os.environ.get("KITTY_CONFIG_DIRECTORY")
@@ -19,158 +36,164 @@ def get_kitty_config_dir() -> Path:
     return Path.home() / ".config" / "kitty"
 
 
-def collect_themes(config_dir: Path) -> list[tuple[str, Path]]:
-    """Collect all .conf theme files under config_dir, sorted by display name."""
-    if not config_dir.is_dir():
-        return []
-    themes: list[tuple[str, Path]] = []
+def get_cache_dir() -> Path:
+    """Cache directory for this tool (respects XDG_CACHE_HOME)."""
+    env = os.environ.get("XDG_CACHE_HOME")
+    base = Path(env).expanduser() if env else Path.home() / ".cache"
+    return base / "kitty-theme-selector"
+
+
+def _walk_conf_files(directory: str, conf_files: list[str], dir_mtimes: dict[str, int]) -> None:
+    """Append every *.conf file under directory to conf_files, recording each subdirectory's mtime_ns."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            # DirEntry type checks come from the directory listing itself, so
+            # plain files cost no extra stat; symlinked themes are still followed
+            if entry.is_dir(follow_symlinks=False):
+                dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                _walk_conf_files(entry.path, conf_files, dir_mtimes)
+            elif entry.name.endswith(".conf") and entry.is_file():
+                conf_files.append(entry.path)
+
+
+def _scan_themes(config_dir: Path) -> tuple[list[tuple[str, Path]], dict[str, int]]:
+    """Walk config_dir; return (themes sorted by display name, mtime_ns of every directory seen)."""
+    root = str(config_dir)
+    conf_files: list[str] = []
+    dir_mtimes = {root: os.stat(root).st_mtime_ns}
+    _walk_conf_files(root, conf_files, dir_mtimes)
+    # Same order as sorting the Path objects: component by component
+    conf_files.sort(key=lambda p: p.split(os.sep))
+    prefix_len = len(os.path.join(root, ""))
+    # Decorated with (lowercased display, walk position): lower() runs once per
+    # theme and the tuples sort in C; the position keeps the sort stable and
+    # means the display/Path columns are never compared
+    decorated: list[tuple[str, int, str, Path]] = []
     seen_stems: set[str] = set()
-    for path in sorted(config_dir.rglob("*.conf")):
-        stem = path.stem
+    for conf_file in conf_files:
+        parent, name = os.path.split(conf_file[prefix_len:])
+        stem = os.path.splitext(name)[0]
         if stem in seen_stems:
             continue
         seen_stems.add(stem)
-        try:
-            rel = path.relative_to(config_dir)
-            display = f"{rel.parent / stem}" if rel.parent != Path(".") else stem
-        except ValueError:
-            display = stem
-        themes.append((display, path))
-    themes.sort(key=lambda t: t[0].lower())
+        display = os.path.join(parent, stem) if parent else stem
+        decorated.append((display.lower(), len(decorated), display, Path(conf_file)))
+    decorated.sort()
+    themes = [(display, path) for _key, _pos, display, path in decorated]
+    return themes, dir_mtimes
+
+
+def _load_theme_cache(cache_file: Path, config_dir: Path) -> list[tuple[str, Path]] | None:
+    """Cached themes for config_dir, or None if missing or any scanned directory changed since."""
+    try:
+        with open(cache_file, "rb") as f:
+            version, cached_dir, dir_mtimes, themes = pickle.load(f)
+        if version != THEME_CACHE_VERSION or cached_dir != str(config_dir):
+            return None
+        if not isinstance(dir_mtimes, dict) or not isinstance(themes, list):
+            return None
+    except Exception:
+        # unpickling damaged data can raise nearly anything; rescan instead
+        return None
+    # Adding, removing or renaming a theme changes the mtime of its directory
+    try:
+        for directory, mtime_ns in dir_mtimes.items():
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return None
+    except (OSError, ValueError, TypeError):
+        return None
     return themes
 
 
-class ThemeSelectorApp(App[None]):
-    """TUI to pick a kitty theme and apply it."""
-
-    TITLE = "Kitty theme selector"
-    SUB_TITLE = "↑/↓ move · Enter apply · / filter · q quit"
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-    #theme-list {
-        height: 1fr;
-        padding: 1 2;
-        border: solid $primary;
-    }
-    ListView {
-        padding: 0 1;
-    }
-    ListItem {
-        padding: 0 1;
-    }
-    ListItem:focus {
-        background: $primary 20%;
-    }
-    #search {
-        width: 100%;
-        margin: 0 2 1 2;
-        max-width: 60;
-    }
-    #status {
-        height: auto;
-        padding: 0 2 1 2;
-        color: $text-muted;
-    }
+def _save_theme_cache(
+    cache_file: Path,
+    config_dir: Path,
+    dir_mtimes: dict[str, int],
+    themes: list[tuple[str, Path]],
+) -> None:
+    """Write the theme cache atomically; a cache that cannot be written is simply skipped."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((THEME_CACHE_VERSION, str(config_dir), dir_mtimes, themes), f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def collect_themes(config_dir: Path) -> list[tuple[str, Path]]:
+    """
+    Collect all .conf theme files under config_dir, sorted by display name.
+
+    The result is kept in $XDG_CACHE_HOME/kitty-theme-selector/themes.pkl
+    with the mtime of every directory scanned; the tree is only walked again
+    when one of those directories has changed.
     """
+    if not config_dir.is_dir():
+        return []
+    cache_file = get_cache_dir() / "themes.pkl"
+    themes = _load_theme_cache(cache_file, config_dir)
+    if themes is None:
+        themes, dir_mtimes = _scan_themes(config_dir)
+        _save_theme_cache(cache_file, config_dir, dir_mtimes, themes)
+    return themes
 
-    BINDINGS = [
-        Binding("q", "quit", "Quit"),
-        Binding("/", "focus_search", "Filter", show=True),
-    ]
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.themes: list[tuple[str, Path]] = []
-        self._filtered: list[tuple[str, Path]] = []
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Input(placeholder="Filter themes...", id="search")
-        yield VerticalScroll(
-            ListView(id="theme-list"),
-            id="list-container",
-        )
-        yield Static("", id="status")
-        yield Footer()
-
-    async def on_mount(self) -> None:
-        config_dir = get_kitty_config_dir()
-        self.themes = collect_themes(config_dir)
-        self._filtered = list(self.themes)
-        await self._refresh_list()
-        search = self.query_one("#search", Input)
-        search.display = False
-
-    async def _refresh_list(self) -> None:
-        lv = self.query_one("#theme-list", ListView)
-        await lv.clear()
-        await lv.extend([
-            ListItem(Label(display)) for display, _path in self._filtered
-        ])
-
-    def _apply_theme(self, path: Path, display: str) -> bool:
-        # Prefer kitten (official remote-control binary); fall back to kitty
-        last_err: str | None = None
-        for cmd in (["kitten", "@", "set-colors", "-a", str(path)], ["kitty", "@", "set-colors", "-a", str(path)]):
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    timeout=30,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    return True
-                last_err = (result.stderr or result.stdout or f"exit {result.returncode}").strip()
-            except FileNotFoundError:
+
+@functools.lru_cache(maxsize=64)
+def _parse_theme_conf(path: str, mtime_ns: int) -> dict[str, int] | None:
+    """Colors from a theme file as RGB ints; None if it needs kitten to interpret it.
+
+    mtime_ns is only part of the cache key, so an edited theme is parsed again.
+    """
+    colors: dict[str, int] = {}
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for raw_line in f:
+            parts = raw_line.split(None, 1)
+            if not parts or parts[0].startswith("#"):
                 continue
-            except subprocess.TimeoutExpired:
-                self.notify(
-                    "Timed out waiting for kitty (try again or increase timeout)",
-                    severity="error",
-                    timeout=6,
-                )
-                return False
-        self.notify(
-            last_err or "Neither kitten nor kitty found in PATH",
-            severity="error",
-            timeout=6,
-        )
-        return False
-
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        idx = event.index
-        if idx < 0 or idx >= len(self._filtered):
-            return
-        display, path = self._filtered[idx]
-        if self._apply_theme(path, display):
-            self.notify(f"Applied: {display}", severity="information", timeout=2)
-            status = self.query_one("#status", Static)
-            status.update(f"Current: {display}")
-
-    def action_focus_search(self) -> None:
-        search = self.query_one("#search", Input)
-        if search.display:
-            search.blur()
-            search.display = False
-        else:
-            search.display = True
-            search.focus()
-
-    def on_input_changed(self, event: Input.Changed) -> None:
-        query = (event.value or "").strip().lower()
-        if not query:
-            self._filtered = list(self.themes)
-        else:
-            self._filtered = [(d, p) for d, p in self.themes if query in d.lower()]
-        self.run_worker(self._refresh_list())
-        status = self.query_one("#status", Static)
-        status.update(f"{len(self._filtered)} theme(s)")
+            key = parts[0]
+            if key not in _COLOR_KEYS and not (key.startswith("color") and key[5:].isdigit()):
+                # include, titlebar colors, newer color options, ...: leave those to kitten
+                return None
+            match = _HEX_COLOR_RE.fullmatch(parts[1].strip()) if len(parts) > 1 else None
+            if match is None:
+                # Named colors, "none", "background", ...: leave those to kitten
+                return None
+            digits = match.group(1)
+            if len(digits) == 3:
+                digits = "".join(c * 2 for c in digits)
+            colors[key] = int(digits, 16)
+    return colors
+
+
+def parse_theme_colors(path: Path) -> dict[str, int] | None:
+    """Cached _parse_theme_conf for path; None if unreadable or not only plain hex colors."""
+    try:
+        return _parse_theme_conf(str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def __getattr__(name: str):
+    # ThemeSelectorApp lives in theme_selector_app so that importing this module
+    # (or running --help) does not pull in Textual
+    if name == "ThemeSelectorApp":
+        from theme_selector_app import ThemeSelectorApp
+        return ThemeSelectorApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
+    import argparse
+    p = argparse.ArgumentParser(description="Kitty theme selector — list themes from your kitty config dir and apply them.")
+    p.parse_args()
+    from theme_selector_app import ThemeSelectorApp
     app = ThemeSelectorApp()
     app.run()
 
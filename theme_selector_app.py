@@ -0,0 +1,211 @@
+"""Textual app for theme_selector; kept separate so the CLI starts without importing Textual."""
+
+import subprocess
+from pathlib import Path
+
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.timer import Timer
+from textual.widgets import Footer, Header, Input, OptionList, Static
+from textual.widgets.option_list import Option
+
+from kitty_remote import KittyRemote, RemoteControlError
+from search_index import NameIndex
+from theme_selector import collect_themes, get_kitty_config_dir, parse_theme_colors
+
+# Keystrokes closer together than this are coalesced into one list refresh.
+REFRESH_DELAY = 0.05
+
+
+class ThemeSelectorApp(App[None]):
+    """TUI to pick a kitty theme and apply it."""
+
+    TITLE = "Kitty theme selector"
+    SUB_TITLE = "↑/↓ move · Enter apply · / filter · q quit"
+    CSS = """
+    Screen {
+        layout: vertical;
+    }
+    #theme-list {
+        height: 1fr;
+        padding: 1 2;
+        border: solid $primary;
+    }
+    OptionList > .option-list--option {
+        padding: 0 1;
+    }
+    #search {
+        width: 100%;
+        margin: 0 2 1 2;
+        max-width: 60;
+    }
+    #status {
+        height: auto;
+        padding: 0 2 1 2;
+        color: $text-muted;
+    }
+    """
+
+    BINDINGS = [
+        Binding("q", "quit", "Quit"),
+        Binding("/", "focus_search", "Filter", show=True),
+    ]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._remote = KittyRemote.from_env()
+        self.themes: list[tuple[str, Path]] = []
+        self._filtered: list[tuple[str, Path]] = []
+        # One Option per entry, built once and re-added on every refresh
+        self._options: list[Option] = []
+        self._filtered_options: list[Option] = []
+        # What the OptionList currently holds (entries and their Options), and
+        # the query it was filtered by; selections index _shown, since
+        # _filtered runs ahead of the screen until the debounce timer fires
+        self._shown: list[tuple[str, Path]] = []
+        self._shown_options: list[Option] = []
+        self._last_query: str | None = None
+        self._refresh_timer: Timer | None = None
+        self._index = NameIndex()
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Input(placeholder="Filter themes...", id="search")
+        # OptionList draws rows itself instead of mounting a widget per entry;
+        # only visible rows are painted, though a refresh still lays out every row
+        yield OptionList(id="theme-list")
+        yield Static("", id="status")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        # Open kitty's socket up front so the first theme apply does not pay for it
+        if self._remote is not None:
+            try:
+                self._remote.connect()
+            except OSError:
+                self._remote = None
+        search = self.query_one("#search", Input)
+        search.display = False
+        self.query_one("#theme-list", OptionList).focus()
+        self.query_one("#status", Static).update("Loading themes…")
+        # Walking the config tree can be slow (NFS home, big dotfile repos); keep it off the UI thread
+        self.run_worker(self._load_themes, thread=True, exclusive=True)
+
+    def _load_themes(self) -> None:
+        themes = collect_themes(get_kitty_config_dir())
+        index = NameIndex(display for display, _path in themes)
+        self.call_from_thread(self._themes_loaded, themes, index)
+
+    def _themes_loaded(self, themes: list[tuple[str, Path]], index: NameIndex) -> None:
+        self.themes = themes
+        self._index = index
+        # Plain Text prompts: nothing to markup-parse when the list re-renders
+        self._options = [Option(Text(display)) for display, _path in self.themes]
+        # Honour anything typed into the filter while we were loading
+        self._last_query = None
+        self._apply_filter(self.query_one("#search", Input).value)
+        self._refresh_list()
+
+    def on_unmount(self) -> None:
+        if self._remote is not None:
+            self._remote.close()
+
+    def _refresh_list(self) -> None:
+        if self._filtered_options == self._shown_options:
+            # Same rows as on screen (e.g. a keystroke every match satisfies)
+            return
+        ol = self.query_one("#theme-list", OptionList)
+        # Clear, refill and re-highlight as one repaint rather than three
+        with self.batch_update():
+            ol.clear_options()
+            ol.add_options(self._filtered_options)
+            if self._filtered:
+                ol.highlighted = 0
+        self._shown = self._filtered
+        self._shown_options = self._filtered_options
+
+    def _apply_theme(self, path: Path, display: str) -> bool:
+        # Send pre-parsed colors straight to kitty's socket when we can
+        if self._remote is not None:
+            colors = parse_theme_colors(path)
+            if colors:
+                try:
+                    self._remote.send("set-colors", {
+                        "colors": colors,
+                        "match_window": "",
+                        "match_tab": "",
+                        "all": True,
+                        "configured": False,
+                        "reset": False,
+                    })
+                    return True
+                except RemoteControlError:
+                    pass
+        # Prefer kitten (official remote-control binary); fall back to kitty
+        last_err: str | None = None
+        for cmd in (["kitten", "@", "set-colors", "-a", str(path)], ["kitty", "@", "set-colors", "-a", str(path)]):
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    timeout=30,
+                    text=True,
+                )
+                if result.returncode == 0:
+                    return True
+                last_err = (result.stderr or result.stdout or f"exit {result.returncode}").strip()
+            except FileNotFoundError:
+                continue
+            except subprocess.TimeoutExpired:
+                self.notify(
+                    "Timed out waiting for kitty (try again or increase timeout)",
+                    severity="error",
+                    timeout=6,
+                )
+                return False
+        self.notify(
+            last_err or "Neither kitten nor kitty found in PATH",
+            severity="error",
+            timeout=6,
+        )
+        return False
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        idx = event.option_index
+        if idx < 0 or idx >= len(self._shown):
+            return
+        display, path = self._shown[idx]
+        if self._apply_theme(path, display):
+            self.notify(f"Applied: {display}", severity="information", timeout=2)
+            status = self.query_one("#status", Static)
+            status.update(f"Current: {display}")
+
+    def action_focus_search(self) -> None:
+        search = self.query_one("#search", Input)
+        if search.display:
+            search.blur()
+            search.display = False
+        else:
+            search.display = True
+            search.focus()
+
+    def _apply_filter(self, value: str) -> bool:
+        """Filter by value; False (and nothing done) if it normalizes to the current query."""
+        query = (value or "").strip().casefold()
+        if query == self._last_query:
+            return False
+        self._last_query = query
+        indices = self._index.search(query)
+        self._filtered = [self.themes[i] for i in indices]
+        self._filtered_options = [self._options[i] for i in indices]
+        status = self.query_one("#status", Static)
+        status.update(f"{len(self._filtered)} theme(s)")
+        return True
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if not self._apply_filter(event.value):
+            return
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(REFRESH_DELAY, self._refresh_list)